@@ -45,6 +45,8 @@ def _split_tags(value: Any) -> list[str] | Any:
         return []
     if isinstance(value, list):
         return value
+    if isinstance(value, tuple):
+        return list(value)
     return [tag for tag in str(value).split(",") if tag]
 
 
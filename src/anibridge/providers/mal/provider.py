@@ -1,9 +1,7 @@
 """AniBridge provider implementation for MyAnimeList."""
 
-import json
 from collections.abc import Mapping, Sequence
 from datetime import UTC, date, datetime
-from json import JSONDecodeError
 from typing import Any, cast
 
 import aiohttp
@@ -76,6 +74,10 @@ _NATIVE_TO_STATUS: dict[MalListStatus, Status] = {
     for status, native in _STATUS_TO_NATIVE.items()
     if status is not Status.REPEATING
 }
+_STATUS_TO_WRITE: dict[Status, tuple[MalListStatus, bool]] = {
+    status: (native, status is Status.REPEATING)
+    for status, native in _STATUS_TO_NATIVE.items()
+}
 
 
 class MalProvider(
@@ -217,7 +219,7 @@ class MalProvider(
                 status = item.list_status or item.node.my_list_status
                 if status is None:
                     continue
-                values = msgspec.json.decode(msgspec.json.encode(status))
+                values = msgspec.to_builtins(status)
                 entries.append(
                     {
                         "id": item.node.id,
@@ -233,7 +235,7 @@ class MalProvider(
             offset += 1000
 
         return BackupArtifact(
-            content=json.dumps(entries, separators=(",", ":")).encode(),
+            content=msgspec.json.encode(entries),
             file_extension=".json",
             media_type="application/json",
         )
@@ -241,12 +243,21 @@ class MalProvider(
     async def import_backup(self, payload: bytes) -> None:
         """Restore MAL list entries from a provider-managed backup artifact."""
         try:
-            data = json.loads(payload.decode())
-        except JSONDecodeError:
+            data = msgspec.json.decode(payload)
+        except msgspec.DecodeError as exc:
             self.log.exception("Failed to decode MAL backup JSON")
-            raise
+            raise ValueError("MAL backup is not valid JSON") from exc
 
-        restore_ids = {int(item["id"]) for item in data}
+        # Convert every entry up front so a malformed item fails before any writes.
+        try:
+            restored = [
+                (int(item.pop("id")), msgspec.convert(item, type=MyAnimeListStatus))
+                for item in data
+            ]
+        except (msgspec.ValidationError, KeyError, TypeError, AttributeError) as exc:
+            self.log.exception("Failed to convert MAL backup entries")
+            raise ValueError("MAL backup entry is invalid") from exc
+        restore_ids = {anime_id for anime_id, _ in restored}
         existing_ids: set[int] = set()
         offset = 0
         while True:
@@ -256,9 +267,7 @@ class MalProvider(
                 break
             offset += 1000
 
-        for item in data:
-            anime_id = int(item.pop("id"))
-            status = msgspec.convert(item, type=MyAnimeListStatus)
+        for anime_id, status in restored:
             await self._client.update_anime_status(
                 anime_id=anime_id,
                 status=status.status,
@@ -495,8 +504,7 @@ class MalProvider(
                 status_value = value.status if isinstance(value, State) else value
                 if not isinstance(status_value, Status):
                     raise ValueError("status must be a Status value")
-                status = _STATUS_TO_NATIVE[status_value]
-                is_rewatching = status_value is Status.REPEATING
+                status, is_rewatching = _STATUS_TO_WRITE[status_value]
             elif field is RecordField.PROGRESS:
                 progress = self._numeric_value(field, value, integer=True)
             elif field is RecordField.RATING:
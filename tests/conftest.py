@@ -1,6 +1,8 @@
 """Pytest fixtures shared across the provider test-suite."""
 
-from collections.abc import Generator
+from array import array
+from collections.abc import Generator, Iterator, MutableMapping
+from dataclasses import dataclass
 from datetime import UTC, date
 
 import pytest
@@ -16,16 +18,86 @@ from anibridge.providers.mal.models import (
     User,
 )
 
+_FIXED_USER = User(id=1, name="Tester", time_zone="UTC")
+
+
+@dataclass(slots=True)
+class _UpdateCall:
+    """Arguments recorded for one fake ``update_anime_status`` call."""
+
+    anime_id: int
+    status: MalListStatus | str | None
+    score: int | None
+    progress: int | None
+    is_rewatching: bool | None
+    start_date: date | None
+    finish_date: date | None
+    num_times_rewatched: int | None
+    tags: tuple[str, ...]
+    comments: str | None
+
+
+class _OfflineAnimeStore(MutableMapping[int, Anime]):
+    """Insertion-ordered anime cache kept as parallel id and anime columns."""
+
+    def __init__(self) -> None:
+        self._ids: list[int] = []
+        self._animes: list[Anime] = []
+        self._index: dict[int, int] = {}
+
+    def __getitem__(self, anime_id: int) -> Anime:
+        return self._animes[self._index[anime_id]]
+
+    def __setitem__(self, anime_id: int, anime: Anime) -> None:
+        position = self._index.get(anime_id)
+        if position is None:
+            self._index[anime_id] = len(self._ids)
+            self._ids.append(anime_id)
+            self._animes.append(anime)
+        else:
+            self._animes[position] = anime
+
+    def __delitem__(self, anime_id: int) -> None:
+        position = self._index.pop(anime_id)
+        del self._ids[position]
+        del self._animes[position]
+        for shifted_id in self._ids[position:]:
+            self._index[shifted_id] -= 1
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._ids.clear()
+        self._animes.clear()
+        self._index.clear()
+
+    def page(self, offset: int, limit: int) -> list[Anime]:
+        """Return a contiguous slice of cached anime in insertion order."""
+        return self._animes[offset : offset + limit]
+
 
 class _FakeMalClient:
     """Lightweight MAL client stub used by tests."""
 
+    __slots__ = (
+        "deleted_ids",
+        "offline_anime_entries",
+        "update_calls",
+        "user",
+        "user_timezone",
+    )
+
     def __init__(self) -> None:
-        self.user = User(id=1, name="Tester", time_zone="UTC")
+        self.user = _FIXED_USER
         self.user_timezone = UTC
-        self.offline_anime_entries: dict[int, Anime] = {}
-        self.update_calls: list[dict] = []
-        self.deleted_ids: list[int] = []
+        self.offline_anime_entries = _OfflineAnimeStore()
+        self.update_calls: list[_UpdateCall] = []
+        self.deleted_ids = array("q")
 
     async def initialize(self) -> None:
         """Initialize stub client; nothing to fetch."""
@@ -33,11 +105,15 @@ class _FakeMalClient:
     async def close(self) -> None:
         """Close stub client; nothing to release."""
 
-    async def clear_cache(self) -> None:
-        """Clear cached entries and recorded calls."""
+    def reset(self) -> None:
+        """Drop cached entries and recorded calls between tests."""
         self.offline_anime_entries.clear()
         self.update_calls.clear()
-        self.deleted_ids.clear()
+        del self.deleted_ids[:]
+
+    async def clear_cache(self) -> None:
+        """Clear cached entries and recorded calls."""
+        self.reset()
 
     async def get_user(self, username: str = "@me") -> User:
         """Return the configured stub user."""
@@ -49,7 +125,7 @@ class _FakeMalClient:
 
     async def search_anime(self, query: str, *, limit: int = 10, nsfw: bool = False):
         """Return cached anime entries up to the requested limit."""
-        return list(self.offline_anime_entries.values())[:limit]
+        return self.offline_anime_entries.page(0, limit)
 
     async def get_user_anime_list(
         self,
@@ -63,12 +139,11 @@ class _FakeMalClient:
         fields=None,
     ) -> AnimePaging:
         """Return a paginated slice of cached anime entries."""
-        items = list(self.offline_anime_entries.values())[offset : offset + limit]
         data = [
             AnimePagingData(node=anime, list_status=anime.my_list_status)
-            for anime in items
+            for anime in self.offline_anime_entries.page(offset, limit)
         ]
-        return AnimePaging(data=data, paging=None)
+        return AnimePaging(data=data)
 
     async def update_anime_status(
         self,
@@ -87,18 +162,19 @@ class _FakeMalClient:
         comments: str | None = None,
     ) -> MyAnimeListStatus:
         """Record an update and return the resulting status."""
-        call = {
-            "anime_id": anime_id,
-            "status": status,
-            "score": score,
-            "progress": progress,
-            "is_rewatching": is_rewatching,
-            "start_date": start_date,
-            "finish_date": finish_date,
-            "num_times_rewatched": num_times_rewatched,
-            "tags": list(tags or []),
-            "comments": comments,
-        }
+        tags_seq = tuple(tags) if tags else ()
+        call = _UpdateCall(
+            anime_id=anime_id,
+            status=status,
+            score=score,
+            progress=progress,
+            is_rewatching=is_rewatching,
+            start_date=start_date,
+            finish_date=finish_date,
+            num_times_rewatched=num_times_rewatched,
+            tags=tags_seq,
+            comments=comments,
+        )
         self.update_calls.append(call)
         normalized_status = (
             None
@@ -115,12 +191,13 @@ class _FakeMalClient:
             start_date=start_date,
             finish_date=finish_date,
             num_times_rewatched=num_times_rewatched,
-            tags=list(tags or []),
+            tags=tags_seq,
             comments=comments,
         )
-        anime = self.offline_anime_entries.setdefault(
-            anime_id, Anime(id=anime_id, title=f"Anime {anime_id}")
-        )
+        anime = self.offline_anime_entries.get(anime_id)
+        if anime is None:
+            anime = Anime(id=anime_id, title=f"Anime {anime_id}")
+            self.offline_anime_entries[anime_id] = anime
         anime.my_list_status = status_model
         return status_model
 
@@ -130,12 +207,24 @@ class _FakeMalClient:
         self.offline_anime_entries.pop(anime_id, None)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def fake_client() -> _FakeMalClient:
-    """Return an isolated fake MAL client instance."""
+    """Return a fake MAL client shared by every test in a module."""
     return _FakeMalClient()
 
 
+@pytest.fixture(autouse=True)
+def reset_fake_client(request: pytest.FixtureRequest) -> Generator[None]:
+    """Reset the shared fake client around each test that uses it."""
+    if "fake_client" not in request.fixturenames:
+        yield
+        return
+    client = request.getfixturevalue("fake_client")
+    client.reset()
+    yield
+    client.reset()
+
+
 @pytest.fixture(autouse=True)
 def disable_rate_limiter(monkeypatch: pytest.MonkeyPatch) -> Generator[None]:
     """Disable limiter behavior and unwrap decorated methods for fast tests."""
@@ -26,6 +26,13 @@ def test_my_anime_list_status_parses_dates_and_tags() -> None:
     assert status.tags == ["fav", "recommend"]
 
 
+def test_my_anime_list_status_accepts_tag_tuples() -> None:
+    """MyAnimeListStatus should store tuple tags as a list of tags."""
+    status = MyAnimeListStatus(tags=("fav", "recommend"))
+
+    assert status.tags == ["fav", "recommend"]
+
+
 def test_my_anime_list_status_handles_invalid_dates() -> None:
     """MyAnimeListStatus should gracefully handle invalid date-like values."""
     status = msgspec.convert(
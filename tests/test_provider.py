@@ -5,6 +5,7 @@ from logging import getLogger
 from typing import Any, cast
 
 import pytest
+import pytest_asyncio
 from anibridge.provider.base import (
     RecordField,
     RecordQuery,
@@ -18,10 +19,12 @@ from anibridge.providers.mal.client import MalClient
 from anibridge.providers.mal.models import Anime, MalListStatus, MyAnimeListStatus
 from anibridge.providers.mal.provider import MalProvider
 
+_BACKUP_IDS = frozenset((101, 102))
 
-@pytest.fixture()
+
+@pytest.fixture(scope="module")
 def provider(fake_client: Any) -> MalProvider:
-    """Return a MAL provider wired to the fake client."""
+    """Return a MAL provider wired to the module's fake client."""
     provider = MalProvider(
         logger=getLogger("tests.provider"),
         config={"token": "fake-token", "client_id": "fake-client-id"},
@@ -30,6 +33,35 @@ def provider(fake_client: Any) -> MalProvider:
     return provider
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def prebuilt_backup(provider: MalProvider, fake_client: Any) -> bytes:
+    """Export a two-entry MAL list backup once per module."""
+    fake_client.reset()
+    fake_client.offline_anime_entries[101] = Anime(
+        id=101,
+        title="Cowboy Bebop",
+        my_list_status=MyAnimeListStatus(
+            status=MalListStatus.COMPLETED,
+            score=9,
+            num_episodes_watched=26,
+            finish_date=date(2026, 1, 3),
+            tags=["classic"],
+        ),
+    )
+    fake_client.offline_anime_entries[102] = Anime(
+        id=102,
+        title="Trigun",
+        my_list_status=MyAnimeListStatus(
+            status=MalListStatus.WATCHING,
+            num_episodes_watched=4,
+        ),
+    )
+    artifact = await provider.export_backup()
+    fake_client.reset()
+    assert artifact is not None
+    return artifact.content
+
+
 def test_record_from_anime_preserves_mal_date_precision(provider: MalProvider) -> None:
     """MAL date fields should remain dates in normalized records."""
     anime = Anime(
@@ -48,7 +80,7 @@ def test_record_from_anime_preserves_mal_date_precision(provider: MalProvider) -
     assert record.values[RecordField.FINISHED_AT] == date(2026, 1, 3)
 
 
-@pytest.mark.asyncio()
+@pytest.mark.asyncio(loop_scope="module")
 async def test_fetch_records_returns_existing_mal_list_state(
     provider: MalProvider,
     fake_client: Any,
@@ -91,7 +123,7 @@ def test_capabilities_include_rewatch_status(provider: MalProvider) -> None:
     assert native_by_semantic[Status.REPEATING] == "watching"
 
 
-@pytest.mark.asyncio()
+@pytest.mark.asyncio(loop_scope="module")
 async def test_repeating_status_writes_mal_rewatching(
     provider: MalProvider,
     fake_client: Any,
@@ -115,8 +147,8 @@ async def test_repeating_status_writes_mal_rewatching(
     )
 
     assert results[0].ok
-    assert fake_client.update_calls[0]["status"] is MalListStatus.WATCHING
-    assert fake_client.update_calls[0]["is_rewatching"] is True
+    assert fake_client.update_calls[0].status is MalListStatus.WATCHING
+    assert fake_client.update_calls[0].is_rewatching is True
 
 
 def test_date_value_accepts_dates_for_date_precision(provider: MalProvider) -> None:
@@ -135,3 +167,87 @@ def test_date_value_accepts_dates_for_date_precision(provider: MalProvider) -> N
             RecordField.STARTED_AT,
             datetime(2026, 1, 2),
         )
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_import_backup_restores_exported_entries(
+    provider: MalProvider,
+    fake_client: Any,
+    prebuilt_backup: bytes,
+) -> None:
+    """Importing an exported backup replays every saved list entry."""
+    await provider.import_backup(prebuilt_backup)
+
+    calls = {call.anime_id: call for call in fake_client.update_calls}
+    assert calls.keys() == _BACKUP_IDS
+    assert calls[101].status is MalListStatus.COMPLETED
+    assert calls[101].score == 9
+    assert calls[101].progress == 26
+    assert calls[101].finish_date == date(2026, 1, 3)
+    assert calls[101].tags == ("classic",)
+    assert calls[102].status is MalListStatus.WATCHING
+    assert calls[102].progress == 4
+    assert not fake_client.deleted_ids
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_import_backup_deletes_entries_missing_from_backup(
+    provider: MalProvider,
+    fake_client: Any,
+    prebuilt_backup: bytes,
+) -> None:
+    """List entries absent from the backup are removed on import."""
+    fake_client.offline_anime_entries[103] = Anime(
+        id=103,
+        title="Outlaw Star",
+        my_list_status=MyAnimeListStatus(status=MalListStatus.DROPPED),
+    )
+
+    await provider.import_backup(prebuilt_backup)
+
+    assert fake_client.deleted_ids.tolist() == [103]
+    assert 103 not in fake_client.offline_anime_entries
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_import_backup_rejects_invalid_json(provider: MalProvider) -> None:
+    """Malformed backups should fail before any list entry is touched."""
+    with pytest.raises(ValueError, match="not valid JSON"):
+        await provider.import_backup(b"{not json")
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_import_backup_replays_duplicate_ids_in_order(
+    provider: MalProvider,
+    fake_client: Any,
+) -> None:
+    """Every entry for a repeated backup id is written in backup order."""
+    await provider.import_backup(
+        b'[{"id":101,"score":9},{"id":102,"status":"watching"},'
+        b'{"id":101,"status":"completed"}]'
+    )
+
+    assert [call.anime_id for call in fake_client.update_calls] == [101, 102, 101]
+    assert fake_client.update_calls[0].score == 9
+    assert fake_client.update_calls[2].status is MalListStatus.COMPLETED
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_import_backup_rejects_malformed_entry_before_reading_list(
+    provider: MalProvider,
+    fake_client: Any,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """An invalid backup entry fails before the current list is fetched."""
+
+    async def fail_list_read(self: Any, **kwargs: Any) -> None:
+        raise AssertionError("list should not be read")
+
+    monkeypatch.setattr(type(fake_client), "get_user_anime_list", fail_list_read)
+
+    with pytest.raises(ValueError, match="entry is invalid"):
+        await provider.import_backup(
+            b'[{"id":101,"status":"watching"},{"id":102,"status":"bogus"}]'
+        )
+
+    assert fake_client.update_calls == []